@@ -1,9 +1,21 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+import pyarrow.csv as pacsv
+import os
+import sys
+import logging
 import time
-from blacklist_manager import BlacklistManager
+import threading
+from functools import lru_cache
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from blacklist_manager import BlacklistManager, RiotRateLimiter, SummonerNotFound, participant_riot_id
 from config import save_config, load_config
-from pprint import PrettyPrinter
+
+# Only warnings and errors are logged unless LOG_LEVEL is set, e.g. LOG_LEVEL=DEBUG
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
 
 # Configure page - must be the first st command
 st.set_page_config(
@@ -16,18 +28,31 @@ st.set_page_config(
     }
 )
 
-# Enable auto-reload
+# Enable auto-reload, only clearing the shared cache when developing
 if not st.session_state.get("auto_reload_enabled"):
-    st.cache_data.clear()
+    if os.environ.get("DEV_RELOAD"):
+        st.cache_data.clear()
     st.session_state.auto_reload_enabled = True
 
-# Create pretty printer
-pp = PrettyPrinter(indent=2, width=80, depth=None, sort_dicts=False)
-print = pp.pprint
+# Region selection options
+REGION_OPTIONS = {
+    "NA1": "North America", 
+    "EUW1": "Europe West",
+    "EUN1": "Europe Nordic & East",
+    "KR": "Korea",
+    "BR1": "Brazil",
+    "JP1": "Japan",
+    "LA1": "Latin America North",
+    "LA2": "Latin America South",
+    "OC1": "Oceania",
+    "TR1": "Turkey",
+    "RU": "Russia"
+}
+REGION_KEYS = list(REGION_OPTIONS)
 
 # Initialize session state variables
-if 'blacklist_manager' not in st.session_state:
-    st.session_state.blacklist_manager = None
+if 'manager_settings' not in st.session_state:
+    st.session_state.manager_settings = None
 if 'summoner' not in st.session_state:
     st.session_state.summoner = None
 if 'match_history' not in st.session_state:
@@ -39,45 +64,243 @@ if 'selected_match' not in st.session_state:
 if 'blacklist_forms' not in st.session_state:
     st.session_state.blacklist_forms = {}
 
+# Initialize session state for blacklist changes waiting to be applied
+if 'pending_blacklist_ops' not in st.session_state:
+    st.session_state.pending_blacklist_ops = []
+
+class MatchNotFinished(Exception):
+    """Raised to keep match details without an end timestamp out of the persistent cache"""
+    def __init__(self, match, participants):
+        super().__init__("Match has no end timestamp")
+        self.match = match
+        self.participants = participants
+
+@st.cache_resource
+def load_config_cached():
+    """Load the saved configuration once, cleared whenever the configuration is saved"""
+    return load_config()
+
 # Functions for search and display
+@st.cache_data(persist="disk", max_entries=2000)
+def get_finished_match_details(_blacklist_manager, match_id):
+    """Get match details of a finished match, persisted to disk across restarts.
+    
+    Finished matches never change, so they are cached without expiry.
+    
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        match_id: The match ID to retrieve details for
+        
+    Returns:
+        tuple: (match_data, participants)
+        
+    Raises:
+        MatchNotFinished: If the match has no end timestamp, which is not cached
+    """
+    match, participants = _blacklist_manager.get_match_details(match_id)
+    if 'gameEndTimestamp' not in match.get('info', {}):
+        raise MatchNotFinished(match, participants)
+    return match, participants
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def get_match_details_cached(_blacklist_manager, match_id):
     """Get cached match details with the blacklist_manager object excluded from hashing.
     
+    Finished matches are served from the persistent cache, anything else
+    is only kept for 5 minutes. Participants are turned into display rows
+    and grouped by team once here so that work is cached along with the details.
+    
     Parameters:
         _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
         match_id: The match ID to retrieve details for
         
     Returns:
-        tuple: (match_data, participants)
+        tuple: (match_data, blue_team, red_team), teams are lists of
+        (summoner_name, tagline, champion, summoner_id) rows
+    """
+    try:
+        match, participants = get_finished_match_details(_blacklist_manager, match_id)
+    except MatchNotFinished as e:
+        match, participants = e.match, e.participants
+    
+    # Build player rows and group them by team in a single pass
+    blue_team, red_team = [], []
+    for p in participants:
+        row = (
+            p.get('summoner_name', 'Unknown Player'),
+            p.get('tagline', ''),
+            p.get('champion', 'Unknown'),
+            p.get('summoner_id', '')
+        )
+        (blue_team if p['team'] == 'Blue' else red_team).append(row)
+    return match, blue_team, red_team
+
+@st.cache_data(ttl=60)
+def get_summoner_cached(_blacklist_manager, name, tag, region):
+    """Get cached summoner data so repeated searches skip the API.
+    
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        name: Summoner name, optionally including the #tagline
+        tag: Summoner tagline
+        region: Region of the manager, so searches in different regions don't collide
+        
+    Returns:
+        dict: Summoner data
     """
-    return _blacklist_manager.get_match_details(match_id)
+    return _blacklist_manager.get_summoner(name, tag)
+
+@st.cache_data(ttl=60)
+def get_match_history_cached(_blacklist_manager, puuid, region, limit=5, start=0):
+    """Get a cached list of match IDs for a summoner.
+    
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        puuid: PUUID of the summoner
+        region: Region of the manager, so lookups in different regions don't collide
+        limit: Number of matches to retrieve
+        start: Index of the first match to retrieve
+        
+    Returns:
+        list: Match IDs
+    """
+    return _blacklist_manager.get_match_history({'puuid': puuid}, limit=limit, start=start)
+
+@st.cache_data(ttl=15, show_spinner=False)
+def get_current_match_cached(_blacklist_manager, puuid, region):
+    """Get the cached current match of a summoner.
+    
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        puuid: PUUID of the summoner
+        region: Region of the manager, so lookups in different regions don't collide
+        
+    Returns:
+        dict: Current match data, or None if the summoner is not in a game
+    """
+    return _blacklist_manager.get_current_match({'puuid': puuid})
+
+def load_match_details(manager, match_ids, max_workers=5):
+    """Load several matches into the cache used for rendering, overlapping their API calls.
+    
+    Going through get_match_details_cached means matches already in the
+    5 minute or the persistent cache don't reach the Riot API again.
+    
+    Parameters:
+        manager: BlacklistManager instance used for the API calls
+        match_ids: List of match IDs to load
+    """
+    if not match_ids:
+        return
+    
+    # Worker threads need the script run context to use the Streamlit cache
+    ctx = get_script_run_ctx()
+    
+    def attach_context():
+        add_script_run_ctx(threading.current_thread(), ctx)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(match_ids)), initializer=attach_context) as executor:
+        futures = {
+            match_id: executor.submit(get_match_details_cached, _blacklist_manager=manager, match_id=match_id)
+            for match_id in match_ids
+        }
+    
+    for match_id, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            # Failed matches are retried and reported when they are rendered
+            logger.warning("Loading match %s failed: %s", match_id, e)
+
+@st.cache_resource(max_entries=8)
+def get_rate_limiter(api_key):
+    """Get the Riot API rate limiter for an API key, shared across sessions and keeping a bucket per region"""
+    return RiotRateLimiter()
+
+@st.cache_resource(max_entries=8)
+def get_manager(api_key, region):
+    """Get the blacklist manager for an API key and region, shared across sessions"""
+    return BlacklistManager(api_key=api_key, region=region, rate_limiter=get_rate_limiter(api_key))
+
+def use_manager_settings(api_key, region):
+    """Switch this session to the blacklist manager for an API key and region"""
+    st.session_state.manager_settings = (api_key, region)
+    return get_manager(api_key, region)
+
+def current_manager():
+    """Get the blacklist manager of this session, or None if it hasn't been set up yet"""
+    settings = st.session_state.manager_settings
+    return get_manager(*settings) if settings else None
 
 def search_summoner(manager, name, tag, save=True, api_key=None, region=None):
     """Search for a summoner and their match history"""
     with st.spinner("Fetching summoner data..."):
-        st.session_state.summoner = manager.get_summoner(name, tag)
+        st.session_state.summoner = get_summoner_cached(manager, name, tag, manager.region)
         
         # Save last used summoner info if preferences are set to save
         if save and api_key and region:
             save_config(api_key, region, name, tag)
+            load_config_cached.clear()
     
     with st.spinner("Retrieving match history..."):
         # Get the 5 most recent matches
-        matches = manager.get_match_history(
-            st.session_state.summoner,
+        matches = get_match_history_cached(
+            manager,
+            st.session_state.summoner['puuid'],
+            manager.region,
             limit=5,
             start=0
         )
         st.session_state.match_history = matches
-        return matches
+    
+    # Load every match into the render cache now so collapsed matches open instantly
+    with st.spinner("Retrieving match details..."):
+        load_match_details(manager, matches)
+    return matches
 
-def display_players(players, team_name):
-    st.subheader(f"{team_name} Team")
+@st.cache_data(ttl=30)
+def get_blacklisted_ids(_blacklist_manager, db_path, version):
+    """Get a snapshot of all blacklisted summoner IDs.
     
-    # Debug information - show first player's data
-    if players and len(players) > 0:
-        st.text(f"Debug - First player data: {players[0]}")
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        db_path: Blacklist database, shared by the managers of every region
+        version: Blacklist version, bumped by the shared store on every add/remove
+        
+    Returns:
+        frozenset: Blacklisted summoner IDs
+    """
+    return _blacklist_manager.get_blacklisted_ids()
+
+def blacklisted_ids_snapshot(manager):
+    """Get the blacklisted ID snapshot for the current blacklist version"""
+    return get_blacklisted_ids(manager, manager.store.db_path, manager.version)
+
+@st.cache_data(ttl=300)
+def get_lowercase_names(_blacklist_manager, db_path, version):
+    """Get the lowercased blacklist names used for filtering.
+    
+    Parameters:
+        _blacklist_manager: BlacklistManager instance (not hashed by Streamlit)
+        db_path: Blacklist database, shared by the managers of every region
+        version: Blacklist version, bumped by the shared store on every add/remove
+        
+    Returns:
+        numpy.ndarray: Lowercased summoner names in blacklist order
+    """
+    names = _blacklist_manager.get_blacklist()['summoner_name'].fillna('').astype(str)
+    return names.str.lower().to_numpy(dtype=str)
+
+def format_player_display(blacklist):
+    """Build the name#tagline display strings for a blacklist dataframe"""
+    names = blacklist['summoner_name'].astype(str)
+    if 'tagline' in blacklist.columns:
+        taglines = blacklist['tagline'].astype('string').fillna('')
+        names = names + ('#' + taglines).where(taglines != '', '')
+    return names.tolist()
+
+def display_players(players, team_name, blacklisted_ids):
+    st.subheader(f"{team_name} Team")
     
     # Create a table for all players
     for i, player in enumerate(players):
@@ -100,9 +323,9 @@ def display_players(players, team_name):
             
             # Blacklist/Remove buttons
             player_id = player.get('summoner_id', '')
-            blacklist_manager = st.session_state.blacklist_manager
+            blacklist_manager = current_manager()
             
-            if player_id and not blacklist_manager.is_blacklisted(player_id):
+            if player_id and player_id not in blacklisted_ids:
                 if middle.button("Blacklist", key=f"blacklist_{player_id}"):
                     st.session_state.player_to_blacklist = {
                         'id': player_id,
@@ -112,15 +335,369 @@ def display_players(players, team_name):
                     st.rerun()
             
             # Remove button if already blacklisted
-            elif player_id and blacklist_manager.is_blacklisted(player_id):
+            elif player_id:
                 if right.button("Remove", key=f"remove_{player_id}"):
                     blacklist_manager.remove_from_blacklist(player_id)
                     st.success(f"Removed {summoner_name} from blacklist")
                     st.rerun()
 
+@lru_cache(maxsize=4096)
+def player_keys(player_id, i, color):
+    """Get the session state and widget keys for a player in a match.
+    
+    Parameters:
+        player_id: Summoner ID of the player
+        i: Index of the match
+        color: Team color, "blue" or "red"
+        
+    Returns:
+        SimpleNamespace: Interned key strings (form, bl, reason, confirm, cancel, rm)
+    """
+    suffix = f"{player_id}_{i}_{color}"
+    return SimpleNamespace(
+        form=sys.intern(f"form_{suffix}"),
+        bl=sys.intern(f"bl_{suffix}"),
+        reason=sys.intern(f"reason_{suffix}"),
+        confirm=sys.intern(f"confirm_{suffix}"),
+        cancel=sys.intern(f"cancel_{suffix}"),
+        rm=sys.intern(f"rm_{suffix}")
+    )
+
+def open_blacklist_form(form_key):
+    """Show the blacklist form for a player"""
+    st.session_state.blacklist_forms[form_key] = True
+
+def close_blacklist_form(form_key):
+    """Hide the blacklist form for a player"""
+    st.session_state.blacklist_forms.pop(form_key, None)
+
+def stage_blacklist_op(op):
+    """Queue a blacklist change to be applied later with the other pending changes.
+    
+    Parameters:
+        op: ('add', summoner_id, summoner_name, tagline, reason) or ('remove', summoner_id)
+    """
+    st.session_state.pending_blacklist_ops.append(op)
+
+def staged_blacklisted_ids(blacklisted_ids):
+    """Get the blacklisted IDs as they will be once the pending changes are applied"""
+    staged = set(blacklisted_ids)
+    for op in st.session_state.pending_blacklist_ops:
+        if op[0] == 'add':
+            staged.add(op[1])
+        else:
+            staged.discard(op[1])
+    return staged
+
+def apply_pending_blacklist_ops(mgr):
+    """Apply all pending blacklist changes with a single save"""
+    success, message = mgr.bulk_apply(st.session_state.pending_blacklist_ops)
+    if success:
+        st.session_state.pending_blacklist_ops = []
+        st.toast(message)
+    else:
+        st.toast(message, icon="⚠️")
+
+def discard_pending_blacklist_ops():
+    """Drop all pending blacklist changes"""
+    st.session_state.pending_blacklist_ops = []
+
+def render_team(players, color, i, blacklisted_ids):
+    """Render one team of a match with blacklist actions for each player.
+    
+    Parameters:
+        players: List of (summoner_name, tagline, champion, summoner_id) rows for this team
+        color: Team color, "blue" or "red", used in the header and widget keys
+        i: Index of the match, used in widget keys
+        blacklisted_ids: Blacklisted summoner IDs, including pending changes
+    
+    Opening and cancelling a form act through on_click callbacks and only
+    rerun the fragment. Confirm and Remove queue a pending change instead of
+    writing to the blacklist straight away.
+    """
+    st.markdown(f"#### {color.title()} Team")
+    for summoner_name, tagline, champion, player_id in players:
+        # Form and widget keys for this player
+        keys = player_keys(player_id, i, color)
+        form_key = keys.form
+        
+        # Show if blacklisted
+        is_blacklisted = player_id in blacklisted_ids
+        prefix = "⚠️ " if is_blacklisted else ""
+        tag_display = f"#{tagline}" if tagline else ""
+        
+        # Display player with action buttons
+        col1, col2 = st.columns([3, 1])
+        col1.markdown(f"{prefix}**{summoner_name}{tag_display}** - {champion}")
+        
+        if player_id and not is_blacklisted:
+            # Show blacklist button or form
+            if form_key not in st.session_state.blacklist_forms:
+                col2.button("Blacklist", key=keys.bl,
+                            on_click=open_blacklist_form, args=(form_key,))
+            else:
+                # Show form for adding to blacklist
+                reason = st.text_input("Reason for blacklisting:", key=keys.reason)
+                col_confirm, col_cancel = st.columns(2)
+                
+                if col_confirm.button("Confirm", key=keys.confirm):
+                    stage_blacklist_op(('add', player_id, summoner_name, tagline, reason))
+                    close_blacklist_form(form_key)
+                    # Rerun the whole app so the pending changes in the sidebar are updated
+                    st.rerun()
+                
+                col_cancel.button("Cancel", key=keys.cancel,
+                                  on_click=close_blacklist_form, args=(form_key,))
+        
+        elif is_blacklisted:
+            if col2.button("Remove", key=keys.rm):
+                stage_blacklist_op(('remove', player_id))
+                # Rerun the whole app so the pending changes in the sidebar are updated
+                st.rerun()
+
+@st.fragment
+def render_match(i, match_id, mgr):
+    """Render a single match so that its buttons only rerun this fragment.
+    
+    Parameters:
+        i: Index of the match in the match history
+        match_id: The match ID to render
+        mgr: BlacklistManager instance
+    """
+    with st.container(border=True):
+        # Only fetch and render the match body while its toggle is on
+        opened = st.toggle(f"Match {i+1}: {match_id}", value=(i==0), key=f"match_open_{i}")
+        if not opened:
+            return
+        
+        # Take the snapshot here, fragment reruns reuse the original arguments
+        blacklisted_ids = staged_blacklisted_ids(blacklisted_ids_snapshot(mgr))
+        
+        try:
+            # Get match details with participants using the cached function
+            match, blue_team, red_team = get_match_details_cached(_blacklist_manager=mgr, match_id=match_id)
+            
+            # Display match details
+            st.markdown(f"### Match Participants")
+            
+            # Use columns for teams
+            team_cols = st.columns(2)
+            
+            with team_cols[0]:
+                render_team(blue_team, "blue", i, blacklisted_ids)
+            
+            with team_cols[1]:
+                render_team(red_team, "red", i, blacklisted_ids)
+            
+        except Exception as e:
+            st.error(f"Error retrieving match details: {str(e)}")
+            st.text(f"Error details: {type(e).__name__}")
+
+@st.fragment
+def render_blacklist(manager):
+    """Render the blacklist table and management tools.
+    
+    Runs as a fragment so typing in the filter or switching actions only
+    reruns this part of the page.
+    
+    Parameters:
+        manager: BlacklistManager instance
+    """
+    blacklist = manager.get_blacklist()
+    
+    if len(blacklist) > 0:
+        # Add a search box for filtering the blacklist
+        search_term = st.text_input("Filter blacklist", placeholder="Search by name...")
+        
+        filtered_blacklist = blacklist
+        if search_term:
+            lower_names = get_lowercase_names(manager, manager.store.db_path, manager.version)
+            mask = np.char.find(lower_names, search_term.lower()) >= 0
+            filtered_blacklist = blacklist.iloc[mask]
+        
+        # Display the blacklist as a table
+        st.dataframe(
+            filtered_blacklist,
+            hide_index=True,
+            column_config={
+                "summoner_id": st.column_config.TextColumn("ID", width="small"),
+                "summoner_name": st.column_config.TextColumn("Name", width="medium"),
+                "tagline": st.column_config.TextColumn("Tagline", width="small"),
+                "reason": st.column_config.TextColumn("Reason", width="large"),
+                "date_added": st.column_config.DatetimeColumn("Added On", format="D MMM YYYY", width="medium"),
+            },
+            use_container_width=True
+        )
+        
+        # Create a column with name#tagline for display, reusing it while the filter is unchanged
+        display_key = (manager.store.db_path, manager.version, search_term)
+        if st.session_state.get('player_display_key') != display_key:
+            st.session_state.player_display = format_player_display(filtered_blacklist)
+            st.session_state.player_display_key = display_key
+        player_display = st.session_state.player_display
+        
+        # Add bulk management section
+        with st.expander("Manage Blacklist"):
+            selected_action = st.radio("Select Action", ["Remove Player", "Export Blacklist", "Import Blacklist"])
+            
+            if selected_action == "Remove Player":
+                selected_summoner_idx = st.selectbox(
+                    "Select a player to remove",
+                    options=range(len(player_display)),
+                    format_func=lambda i: player_display[i],
+                    index=None
+                )
+                
+                if selected_summoner_idx is not None:
+                    summoner_id = filtered_blacklist.iloc[selected_summoner_idx]['summoner_id']
+                    summoner_name = player_display[selected_summoner_idx]
+                    if st.button(f"Remove {summoner_name}", type="primary"):
+                        if manager.remove_from_blacklist(summoner_id):
+                            st.success(f"{summoner_name} has been removed from the blacklist")
+                            st.rerun()
+                        else:
+                            st.error("Failed to remove from blacklist")
+            
+            elif selected_action == "Export Blacklist":
+                # Convert the blacklist to CSV only when the download is clicked
+                st.download_button(
+                    label="Download Blacklist CSV",
+                    data=lambda: blacklist.to_csv(index=False).encode(),
+                    file_name="lol_blacklist.csv",
+                    mime="text/csv",
+                )
+            
+            elif selected_action == "Import Blacklist":
+                st.warning("This will merge the imported blacklist with your current blacklist")
+                uploaded_file = st.file_uploader("Upload Blacklist CSV", type="csv")
+                if uploaded_file is not None:
+                    try:
+                        table = pacsv.read_csv(uploaded_file, read_options=pacsv.ReadOptions(use_threads=True))
+                        import_blacklist = table.to_pandas()
+                        required_columns = ['summoner_id', 'summoner_name', 'reason']
+                        if all(col in import_blacklist.columns for col in required_columns):
+                            # TODO: Add merge functionality
+                            st.info("Import functionality coming soon")
+                        else:
+                            st.error("Invalid blacklist format. CSV must contain summoner_id, summoner_name, and reason columns")
+                    except Exception as e:
+                        st.error(f"Error importing blacklist: {str(e)}")
+    else:
+        st.info("Your blacklist is empty")
+        
+        # Add example card for empty state
+        with st.container():
+            st.markdown("### How to use the Blacklist")
+            st.markdown("""
+            1. Search for players in the Matches tab
+            2. Click 'Blacklist' on problematic players
+            3. Add a reason for blacklisting
+            4. Use this tab to manage your blacklist
+            """)
+
+def render_live_team(players, title, reasons):
+    """Render one team of a live game, highlighting blacklisted players.
+    
+    Parameters:
+        players: List of spectator participant dicts for this team
+        title: Header shown above the team
+        reasons: Dict of blacklist reasons keyed by summoner ID, only for blacklisted players
+    """
+    st.markdown(f"### {title}")
+    for player in players:
+        # Check if blacklisted
+        player_id = player.get('summonerId', player.get('id', ''))
+        is_blacklisted = player_id in reasons
+        
+        # Get summoner name using v5 API field structure
+        summoner_name, tagline = participant_riot_id(player)
+        
+        # Get champion name if possible - otherwise use ID
+        champion = player.get('championName', player.get('championId', 'Unknown'))
+        
+        # Format the tag display
+        tag_display = f"#{tagline}" if tagline else ""
+        
+        # Display player info with blacklist indicator
+        if is_blacklisted:
+            st.markdown(f"⚠️ **{summoner_name}{tag_display}** - {champion}")
+            
+            st.caption(f"Reason: {reasons[player_id]}")
+        else:
+            st.markdown(f"**{summoner_name}{tag_display}** - {champion}")
+
+def render_live_game(mgr, live_summoner, live_summoner_name):
+    """Check and render the current game of a summoner.
+    
+    Called as a fragment, with run_every set while auto-refresh is on, so
+    only this part of the page is rechecked on each refresh.
+    
+    Parameters:
+        mgr: BlacklistManager instance
+        live_summoner: Summoner data of the player to check
+        live_summoner_name: Name of the player, used in messages
+    """
+    try:
+        # Check current match
+        current_match = get_current_match_cached(mgr, live_summoner['puuid'], mgr.region)
+        
+        if current_match:
+            # Get all players and check against blacklist
+            blacklisted_players = mgr.check_current_match_for_blacklisted(live_summoner, current_match)
+            
+            # Display game info
+            st.success(f"Found active game! Queue type: {current_match.get('gameQueueConfigId', 'Unknown')}")
+            
+            # Log participant structure for debugging
+            if 'participants' in current_match and len(current_match['participants']) > 0:
+                st.session_state.live_game_debug = True
+                first_player = current_match['participants'][0]
+                st.text(f"Participant data structure: {list(first_player.keys())}")
+            
+            # Create two columns for blue and red team
+            team_cols = st.columns(2)
+            
+            # Group participants by team in a single pass
+            blue_team, red_team = [], []
+            for p in current_match['participants']:
+                team = p.get('teamId', p.get('team', ''))
+                if team == 100:
+                    blue_team.append(p)
+                elif team == 200:
+                    red_team.append(p)
+            
+            # Reasons of the blacklisted players found above, shared by both teams
+            reasons = {player['summoner_id']: player['reason'] for player in blacklisted_players}
+            
+            # Show blue team
+            with team_cols[0]:
+                render_live_team(blue_team, "🔵 Blue Team", reasons)
+            
+            # Show red team
+            with team_cols[1]:
+                render_live_team(red_team, "🔴 Red Team", reasons)
+            
+            # Display summary of blacklisted players
+            if blacklisted_players:
+                st.markdown("### ⚠️ Blacklisted Players Summary")
+                for player in blacklisted_players:
+                    # The summoner_name already includes the tagline from our BlacklistManager changes
+                    st.warning(
+                        f"**{player['summoner_name']}** - {player['champion']}\n\n"
+                        f"Reason: {player['reason']}\n\n"
+                        f"Added: {player['date_added']}"
+                    )
+            else:
+                st.success("No blacklisted players found in this game! 👍")
+        else:
+            st.info(f"{live_summoner_name} is not currently in a game. Check again when they're in a match.")
+    
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+
 def add_to_blacklist(summoner_id, summoner_name, tagline, reason):
     """Add a player to blacklist and show success message"""
-    success, message = st.session_state.blacklist_manager.add_to_blacklist(
+    success, message = current_manager().add_to_blacklist(
         summoner_id=summoner_id,
         summoner_name=summoner_name,
         reason=reason,
@@ -135,7 +712,7 @@ def add_to_blacklist(summoner_id, summoner_name, tagline, reason):
 
 def remove_from_blacklist(summoner_id, summoner_name):
     """Remove a player from blacklist and show success message"""
-    if st.session_state.blacklist_manager.remove_from_blacklist(summoner_id):
+    if current_manager().remove_from_blacklist(summoner_id):
         st.success(f"{summoner_name} removed from blacklist")
         st.rerun()
     else:
@@ -151,7 +728,8 @@ def main():
     st.title("League of Legends Blacklist System")
     
     # Load saved configuration values
-    api_key, region, last_username, last_tagline = load_config()
+    api_key, region, last_username, last_tagline = load_config_cached()
+    manager = current_manager()
     
     # Sidebar for user input
     with st.sidebar:
@@ -161,25 +739,11 @@ def main():
                                        type="password", help="Enter your Riot API Key")
             
             # Region selection
-            region_options = {
-                "NA1": "North America", 
-                "EUW1": "Europe West",
-                "EUN1": "Europe Nordic & East",
-                "KR": "Korea",
-                "BR1": "Brazil",
-                "JP1": "Japan",
-                "LA1": "Latin America North",
-                "LA2": "Latin America South",
-                "OC1": "Oceania",
-                "TR1": "Turkey",
-                "RU": "Russia"
-            }
-            
             region_input = st.selectbox(
                 "Region", 
-                options=list(region_options.keys()),
-                format_func=lambda x: region_options.get(x, x),
-                index=list(region_options.keys()).index(region) if region in region_options else 0
+                options=REGION_KEYS,
+                format_func=lambda x: REGION_OPTIONS.get(x, x),
+                index=REGION_KEYS.index(region) if region in REGION_OPTIONS else 0
             )
             
             # Save preferences checkbox
@@ -190,10 +754,11 @@ def main():
                 if api_key_input:
                     if save_preferences:
                         save_config(api_key_input, region_input, last_username, last_tagline)
+                        load_config_cached.clear()
                         st.success("Settings saved!")
                     
                     # Initialize blacklist manager
-                    st.session_state.blacklist_manager = BlacklistManager(api_key=api_key_input, region=region_input)
+                    manager = use_manager_settings(api_key_input, region_input)
                     st.success("Blacklist Manager initialized!")
                 else:
                     st.error("Please enter your Riot API Key")
@@ -213,17 +778,16 @@ def main():
             search_button = st.form_submit_button("Search", use_container_width=True, type="primary")
         
         if search_button:
-            if not st.session_state.blacklist_manager:
-                if api_key_input:
-                    st.session_state.blacklist_manager = BlacklistManager(api_key=api_key_input, region=region_input)
-                else:
-                    st.error("Please set up your API key first")
-                    st.stop()
+            if api_key_input:
+                manager = use_manager_settings(api_key_input, region_input)
+            elif not manager:
+                st.error("Please set up your API key first")
+                st.stop()
             
             if summoner_name:
                 try:
                     matches = search_summoner(
-                        st.session_state.blacklist_manager, 
+                        manager, 
                         summoner_name, 
                         tagline, 
                         save_preferences,
@@ -240,6 +804,15 @@ def main():
                     st.session_state.match_history = None
             else:
                 st.error("Please enter a summoner name")
+        
+        # Pending blacklist changes from the match history
+        pending_ops = st.session_state.pending_blacklist_ops
+        if pending_ops and manager:
+            st.divider()
+            st.subheader("Pending Changes")
+            st.button(f"Apply {len(pending_ops)} changes", use_container_width=True, type="primary",
+                      on_click=apply_pending_blacklist_ops, args=(manager,))
+            st.button("Discard changes", use_container_width=True, on_click=discard_pending_blacklist_ops)
     
     # Main content area with tabs
     tab1, tab2, tab3, tab4 = st.tabs(["📋 Matches", "📑 Blacklist", "🔍 Live Game Checker", "ℹ️ Help"])
@@ -249,6 +822,9 @@ def main():
         if st.session_state.summoner:
             summoner = st.session_state.summoner
             
+            # Take a single snapshot of the blacklist for this render
+            blacklisted_ids = blacklisted_ids_snapshot(manager)
+            
             # Display summoner name (using different key based on the API response)
             if 'name' in summoner:
                 summoner_name = summoner['name']
@@ -270,7 +846,7 @@ def main():
                 
                 with col_status:
                     # Check if the summoner is blacklisted
-                    if 'id' in summoner and st.session_state.blacklist_manager.is_blacklisted(summoner['id']):
+                    if 'id' in summoner and summoner['id'] in blacklisted_ids:
                         st.warning("⚠️ This summoner is in your blacklist!")
                 
                 with col_refresh:
@@ -278,8 +854,10 @@ def main():
                     if st.button("🔄 Refresh Matches", use_container_width=True):
                         with st.spinner("Retrieving match history..."):
                             # Get the 5 most recent matches
-                            matches = st.session_state.blacklist_manager.get_match_history(
-                                st.session_state.summoner,
+                            matches = get_match_history_cached(
+                                manager,
+                                st.session_state.summoner['puuid'],
+                                manager.region,
                                 limit=5,
                                 start=0
                             )
@@ -294,146 +872,16 @@ def main():
                     if matches:
                         st.subheader("Recent Matches")
                         
-                        # Display each match in an expander
+                        # Load all opened matches up front so the API calls overlap, cached ones are skipped
+                        opened_matches = [
+                            match_id for i, match_id in enumerate(matches)
+                            if st.session_state.get(f"match_open_{i}", i==0)
+                        ]
+                        load_match_details(manager, opened_matches)
+                        
+                        # Display each match in its own fragment
                         for i, match_id in enumerate(matches):
-                            with st.expander(f"Match {i+1}: {match_id}", expanded=(i==0)):
-                                try:
-                                    # Get match details with participants using the cached function
-                                    match, participants = get_match_details_cached(_blacklist_manager=st.session_state.blacklist_manager, match_id=match_id)
-                                    
-                                    # Group participants by team
-                                    blue_team = [p for p in participants if p['team'] == 'Blue']
-                                    red_team = [p for p in participants if p['team'] == 'Red']
-                                    
-                                    # Display match details
-                                    st.markdown(f"### Match Participants")
-                                    
-                                    # Use columns for teams
-                                    team_cols = st.columns(2)
-                                    
-                                    with team_cols[0]:
-                                        st.markdown("#### Blue Team")
-                                        for player in blue_team:
-                                            # Get player info
-                                            summoner_name = player.get('summoner_name', 'Unknown Player')
-                                            tagline = player.get('tagline', '')
-                                            champion = player.get('champion', 'Unknown')
-                                            player_id = player.get('summoner_id', '')
-                                            
-                                            # Form key for this player
-                                            form_key = f"form_{player_id}_{i}_blue"
-                                            
-                                            # Show if blacklisted
-                                            is_blacklisted = st.session_state.blacklist_manager.is_blacklisted(player_id)
-                                            prefix = "⚠️ " if is_blacklisted else ""
-                                            tag_display = f"#{tagline}" if tagline else ""
-                                            
-                                            # Display player with action buttons
-                                            col1, col2 = st.columns([3, 1])
-                                            col1.markdown(f"{prefix}**{summoner_name}{tag_display}** - {champion}")
-                                            
-                                            if player_id and not is_blacklisted:
-                                                # Show blacklist button or form
-                                                if form_key not in st.session_state.blacklist_forms:
-                                                    if col2.button("Blacklist", key=f"bl_{player_id}_{i}_blue"):
-                                                        st.session_state.blacklist_forms[form_key] = True
-                                                        st.rerun()
-                                                else:
-                                                    # Show form for adding to blacklist
-                                                    reason = st.text_input("Reason for blacklisting:", key=f"reason_{player_id}_{i}_blue")
-                                                    col_confirm, col_cancel = st.columns(2)
-                                                    
-                                                    if col_confirm.button("Confirm", key=f"confirm_{player_id}_{i}_blue"):
-                                                        # Call the add_to_blacklist function with all required parameters
-                                                        success, message = st.session_state.blacklist_manager.add_to_blacklist(
-                                                            summoner_id=player_id,
-                                                            summoner_name=summoner_name,
-                                                            reason=reason,
-                                                            tagline=tagline
-                                                        )
-                                                        
-                                                        if success:
-                                                            st.success(message)
-                                                            # Remove form from session state
-                                                            del st.session_state.blacklist_forms[form_key]
-                                                            st.rerun()
-                                                        else:
-                                                            st.warning(message)
-                                                    
-                                                    if col_cancel.button("Cancel", key=f"cancel_{player_id}_{i}_blue"):
-                                                        # Remove form from session state
-                                                        del st.session_state.blacklist_forms[form_key]
-                                                        st.rerun()
-                                            
-                                            elif is_blacklisted:
-                                                if col2.button("Remove", key=f"rm_{player_id}_{i}_blue"):
-                                                    st.session_state.blacklist_manager.remove_from_blacklist(player_id)
-                                                    st.success(f"Removed {summoner_name} from blacklist")
-                                                    st.rerun()
-                                    
-                                    with team_cols[1]:
-                                        st.markdown("#### Red Team")
-                                        for player in red_team:
-                                            # Get player info
-                                            summoner_name = player.get('summoner_name', 'Unknown Player')
-                                            tagline = player.get('tagline', '')
-                                            champion = player.get('champion', 'Unknown')
-                                            player_id = player.get('summoner_id', '')
-                                            
-                                            # Form key for this player
-                                            form_key = f"form_{player_id}_{i}_red"
-                                            
-                                            # Show if blacklisted
-                                            is_blacklisted = st.session_state.blacklist_manager.is_blacklisted(player_id)
-                                            prefix = "⚠️ " if is_blacklisted else ""
-                                            tag_display = f"#{tagline}" if tagline else ""
-                                            
-                                            # Display player with action buttons
-                                            col1, col2 = st.columns([3, 1])
-                                            col1.markdown(f"{prefix}**{summoner_name}{tag_display}** - {champion}")
-                                            
-                                            if player_id and not is_blacklisted:
-                                                # Show blacklist button or form
-                                                if form_key not in st.session_state.blacklist_forms:
-                                                    if col2.button("Blacklist", key=f"bl_{player_id}_{i}_red"):
-                                                        st.session_state.blacklist_forms[form_key] = True
-                                                        st.rerun()
-                                                else:
-                                                    # Show form for adding to blacklist
-                                                    reason = st.text_input("Reason for blacklisting:", key=f"reason_{player_id}_{i}_red")
-                                                    col_confirm, col_cancel = st.columns(2)
-                                                    
-                                                    if col_confirm.button("Confirm", key=f"confirm_{player_id}_{i}_red"):
-                                                        # Call the add_to_blacklist function with all required parameters
-                                                        success, message = st.session_state.blacklist_manager.add_to_blacklist(
-                                                            summoner_id=player_id,
-                                                            summoner_name=summoner_name,
-                                                            reason=reason,
-                                                            tagline=tagline
-                                                        )
-                                                        
-                                                        if success:
-                                                            st.success(message)
-                                                            # Remove form from session state
-                                                            del st.session_state.blacklist_forms[form_key]
-                                                            st.rerun()
-                                                        else:
-                                                            st.warning(message)
-                                                    
-                                                    if col_cancel.button("Cancel", key=f"cancel_{player_id}_{i}_red"):
-                                                        # Remove form from session state
-                                                        del st.session_state.blacklist_forms[form_key]
-                                                        st.rerun()
-                                            
-                                            elif is_blacklisted:
-                                                if col2.button("Remove", key=f"rm_{player_id}_{i}_red"):
-                                                    st.session_state.blacklist_manager.remove_from_blacklist(player_id)
-                                                    st.success(f"Removed {summoner_name} from blacklist")
-                                                    st.rerun()
-                                    
-                                except Exception as e:
-                                    st.error(f"Error retrieving match details: {str(e)}")
-                                    st.text(f"Error details: {type(e).__name__}")
+                            render_match(i, match_id, manager)
                     else:
                         st.info("No match history found for this summoner.")
         else:
@@ -458,101 +906,12 @@ def main():
         st.header("Blacklist Manager")
         st.markdown("View, search, and manage your blacklisted players")
         
-        if st.session_state.blacklist_manager:
-            blacklist = st.session_state.blacklist_manager.get_blacklist()
-            
+        if manager:
             # Add refresh button
             if st.button("Refresh Blacklist"):
                 st.rerun()
             
-            if len(blacklist) > 0:
-                # Add a search box for filtering the blacklist
-                search_term = st.text_input("Filter blacklist", placeholder="Search by name...")
-                
-                filtered_blacklist = blacklist
-                if search_term:
-                    filtered_blacklist = blacklist[blacklist['summoner_name'].str.contains(search_term, case=False)]
-                
-                # Display the blacklist as a table
-                st.dataframe(
-                    filtered_blacklist,
-                    hide_index=True,
-                    column_config={
-                        "summoner_id": st.column_config.TextColumn("ID", width="small"),
-                        "summoner_name": st.column_config.TextColumn("Name", width="medium"),
-                        "tagline": st.column_config.TextColumn("Tagline", width="small"),
-                        "reason": st.column_config.TextColumn("Reason", width="large"),
-                        "date_added": st.column_config.DatetimeColumn("Added On", format="D MMM YYYY", width="medium"),
-                    },
-                    use_container_width=True
-                )
-                
-                # Create a column with name#tagline for display
-                player_display = []
-                for _, row in filtered_blacklist.iterrows():
-                    name = row['summoner_name']
-                    tagline = row.get('tagline', '')
-                    tag_display = f"#{tagline}" if tagline else ""
-                    player_display.append(f"{name}{tag_display}")
-                
-                # Add bulk management section
-                with st.expander("Manage Blacklist"):
-                    selected_action = st.radio("Select Action", ["Remove Player", "Export Blacklist", "Import Blacklist"])
-                    
-                    if selected_action == "Remove Player":
-                        selected_summoner_idx = st.selectbox(
-                            "Select a player to remove",
-                            options=range(len(player_display)),
-                            format_func=lambda i: player_display[i],
-                            index=None
-                        )
-                        
-                        if selected_summoner_idx is not None:
-                            summoner_id = filtered_blacklist.iloc[selected_summoner_idx]['summoner_id']
-                            summoner_name = player_display[selected_summoner_idx]
-                            if st.button(f"Remove {summoner_name}", type="primary"):
-                                if st.session_state.blacklist_manager.remove_from_blacklist(summoner_id):
-                                    st.success(f"{summoner_name} has been removed from the blacklist")
-                                    st.rerun()
-                                else:
-                                    st.error("Failed to remove from blacklist")
-                    
-                    elif selected_action == "Export Blacklist":
-                        # Convert the blacklist to CSV for download
-                        csv = blacklist.to_csv(index=False)
-                        st.download_button(
-                            label="Download Blacklist CSV",
-                            data=csv,
-                            file_name="lol_blacklist.csv",
-                            mime="text/csv",
-                        )
-                    
-                    elif selected_action == "Import Blacklist":
-                        st.warning("This will merge the imported blacklist with your current blacklist")
-                        uploaded_file = st.file_uploader("Upload Blacklist CSV", type="csv")
-                        if uploaded_file is not None:
-                            try:
-                                import_blacklist = pd.read_csv(uploaded_file)
-                                required_columns = ['summoner_id', 'summoner_name', 'reason']
-                                if all(col in import_blacklist.columns for col in required_columns):
-                                    # TODO: Add merge functionality
-                                    st.info("Import functionality coming soon")
-                                else:
-                                    st.error("Invalid blacklist format. CSV must contain summoner_id, summoner_name, and reason columns")
-                            except Exception as e:
-                                st.error(f"Error importing blacklist: {str(e)}")
-            else:
-                st.info("Your blacklist is empty")
-                
-                # Add example card for empty state
-                with st.container():
-                    st.markdown("### How to use the Blacklist")
-                    st.markdown("""
-                    1. Search for players in the Matches tab
-                    2. Click 'Blacklist' on problematic players
-                    3. Add a reason for blacklisting
-                    4. Use this tab to manage your blacklist
-                    """)
+            render_blacklist(manager)
         else:
             st.warning("Please set up your API key in the sidebar first")
     
@@ -570,143 +929,32 @@ def main():
         
         # Add a manual refresh button outside the form
         if auto_refresh and 'live_summoner' in st.session_state:
-            st.button("🔄 Refresh Now", on_click=lambda: None)  # This will cause a rerun when clicked
+            st.button("🔄 Refresh Now", on_click=get_current_match_cached.clear)  # Force a fresh check
         
         if submitted or ('live_summoner' in st.session_state and auto_refresh):
             try:
                 # Get the summoner data
                 if submitted:
                     # New search, so fetch summoner data
-                    live_summoner = st.session_state.blacklist_manager.get_summoner(
-                        live_summoner_name, live_summoner_tag
+                    live_summoner = get_summoner_cached(
+                        manager,
+                        live_summoner_name,
+                        live_summoner_tag,
+                        manager.region
                     )
                     st.session_state.live_summoner = live_summoner
                 else:
                     # Use cached summoner data for auto-refresh
                     live_summoner = st.session_state.live_summoner
                 
-                # Check current match
-                current_match = st.session_state.blacklist_manager.get_current_match(live_summoner)
-                
-                if current_match:
-                    # Get all players and check against blacklist
-                    blacklisted_players = st.session_state.blacklist_manager.check_current_match_for_blacklisted(live_summoner)
-                    
-                    # Display game info
-                    st.success(f"Found active game! Queue type: {current_match.get('gameQueueConfigId', 'Unknown')}")
-                    
-                    # Log participant structure for debugging
-                    if 'participants' in current_match and len(current_match['participants']) > 0:
-                        st.session_state.live_game_debug = True
-                        first_player = current_match['participants'][0]
-                        st.text(f"Participant data structure: {list(first_player.keys())}")
-                    
-                    # Create two columns for blue and red team
-                    team_cols = st.columns(2)
-                    
-                    # Group participants by team
-                    blue_team = [p for p in current_match['participants'] if p.get('teamId', p.get('team', '')) == 100]
-                    red_team = [p for p in current_match['participants'] if p.get('teamId', p.get('team', '')) == 200]
-                    
-                    # Show blue team
-                    with team_cols[0]:
-                        st.markdown("### 🔵 Blue Team")
-                        for player in blue_team:
-                            # Check if blacklisted
-                            player_id = player.get('summonerId', player.get('id', ''))
-                            is_blacklisted = st.session_state.blacklist_manager.is_blacklisted(player_id)
-                            
-                            # Get summoner name using v5 API field structure
-                            if 'riotId' in player:
-                                # v5 API has riotId object
-                                riot_id = player.get('riotId', {})
-                                summoner_name = riot_id.get('gameName', 'Unknown Player')
-                                tagline = riot_id.get('tagLine', '')
-                            else:
-                                # Try other fields that might contain the name
-                                summoner_name = player.get('summonerName', 
-                                             player.get('name', 
-                                             player.get('riotIdGameName', 'Unknown Player')))
-                                tagline = player.get('riotIdTagline', '')
-                            
-                            # Get champion name if possible - otherwise use ID
-                            champion = player.get('championName', player.get('championId', 'Unknown'))
-                            
-                            # Format the tag display
-                            tag_display = f"#{tagline}" if tagline else ""
-                            
-                            # Display player info with blacklist indicator
-                            if is_blacklisted:
-                                st.markdown(f"⚠️ **{summoner_name}{tag_display}** - {champion}")
-                                
-                                # Get reason from blacklist
-                                blacklist = st.session_state.blacklist_manager.get_blacklist()
-                                player_info = blacklist[blacklist['summoner_id'] == player_id].iloc[0]
-                                reason = player_info['reason']
-                                st.caption(f"Reason: {reason}")
-                            else:
-                                st.markdown(f"**{summoner_name}{tag_display}** - {champion}")
-                    
-                    # Show red team
-                    with team_cols[1]:
-                        st.markdown("### 🔴 Red Team")
-                        for player in red_team:
-                            # Check if blacklisted
-                            player_id = player.get('summonerId', player.get('id', ''))
-                            is_blacklisted = st.session_state.blacklist_manager.is_blacklisted(player_id)
-                            
-                            # Get summoner name using v5 API field structure
-                            if 'riotId' in player:
-                                # v5 API has riotId object
-                                riot_id = player.get('riotId', {})
-                                summoner_name = riot_id.get('gameName', 'Unknown Player')
-                                tagline = riot_id.get('tagLine', '')
-                            else:
-                                # Try other fields that might contain the name
-                                summoner_name = player.get('summonerName', 
-                                             player.get('name', 
-                                             player.get('riotIdGameName', 'Unknown Player')))
-                                tagline = player.get('riotIdTagline', '')
-                            
-                            # Get champion name if possible - otherwise use ID
-                            champion = player.get('championName', player.get('championId', 'Unknown'))
-                            
-                            # Format the tag display
-                            tag_display = f"#{tagline}" if tagline else ""
-                            
-                            # Display player info with blacklist indicator
-                            if is_blacklisted:
-                                st.markdown(f"⚠️ **{summoner_name}{tag_display}** - {champion}")
-                                
-                                # Get reason from blacklist
-                                blacklist = st.session_state.blacklist_manager.get_blacklist()
-                                player_info = blacklist[blacklist['summoner_id'] == player_id].iloc[0]
-                                reason = player_info['reason']
-                                st.caption(f"Reason: {reason}")
-                            else:
-                                st.markdown(f"**{summoner_name}{tag_display}** - {champion}")
-                    
-                    # Display summary of blacklisted players
-                    if blacklisted_players:
-                        st.markdown("### ⚠️ Blacklisted Players Summary")
-                        for player in blacklisted_players:
-                            # The summoner_name already includes the tagline from our BlacklistManager changes
-                            st.warning(
-                                f"**{player['summoner_name']}** - {player['champion']}\n\n"
-                                f"Reason: {player['reason']}\n\n"
-                                f"Added: {player['date_added']}"
-                            )
-                    else:
-                        st.success("No blacklisted players found in this game! 👍")
-                else:
-                    st.info(f"{live_summoner_name} is not currently in a game. Check again when they're in a match.")
+                # Check the current match, rechecking every 30 seconds while auto-refresh is on
+                live_game_fragment = st.fragment(render_live_game, run_every=30 if auto_refresh else None)
+                live_game_fragment(manager, live_summoner, live_summoner_name)
             
+            except SummonerNotFound as e:
+                st.info(str(e))
             except Exception as e:
-                # Only show error if it's not a simple "not in game" issue
-                if "not in a game" not in str(e) and "Could not find summoner" not in str(e):
-                    st.error(f"Error: {str(e)}")
-                else:
-                    st.info(str(e))
+                st.error(f"Error: {str(e)}")
         else:
             st.info("Enter a summoner name to check their current game")
     
@@ -729,6 +977,7 @@ def main():
         ### Managing Your Blacklist
         - Click "Blacklist" next to any player to add them to your blacklist
         - Add a reason to help you remember why they were blacklisted
+        - Changes made in the match history are saved when you click "Apply changes" in the sidebar
         - Use the Blacklist tab to view and manage your blacklisted players
         - You can filter the blacklist by player name
         
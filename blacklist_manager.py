@@ -1,75 +1,450 @@
 import pandas as pd
 import os
 import json
-from riotwatcher import LolWatcher, ApiError
-from datetime import datetime
-from pprint import PrettyPrinter
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from riotwatcher import LolWatcher, ApiError, RateLimiter
+from riotwatcher.Handlers.RateLimit import BasicRateLimiter
+from datetime import datetime, timedelta
+from types import MappingProxyType
 
-# Create a PrettyPrinter instance with custom settings
-pp = PrettyPrinter(indent=2, width=80, depth=None, sort_dicts=False)
-# Override print with our pretty printer
-print = pp.pprint
+logger = logging.getLogger(__name__)
+
+# Map region to platform, continent and default tagline
+REGION_TO_PLATFORM = MappingProxyType({
+    "na1": "na1", "euw1": "euw1", "eun1": "eun1", "kr": "kr",
+    "br1": "br1", "jp1": "jp1", "la1": "la1", "la2": "la2",
+    "oc1": "oc1", "tr1": "tr1", "ru": "ru"
+})
+
+REGION_TO_CONTINENT = MappingProxyType({
+    "na1": "americas", "br1": "americas", "la1": "americas", "la2": "americas",
+    "euw1": "europe", "eun1": "europe", "tr1": "europe", "ru": "europe",
+    "kr": "asia", "jp1": "asia", "oc1": "sea"
+})
+
+REGION_TO_TAGLINE = MappingProxyType({
+    "na1": "NA1", "euw1": "EUW1", "eun1": "EUN1", "kr": "KR",
+    "br1": "BR1", "jp1": "JP1", "la1": "LA1", "la2": "LA2",
+    "oc1": "OC1", "tr1": "TR1", "ru": "RU"
+})
+
+# Team names by match-v5 team ID
+TEAM_NAMES = MappingProxyType({100: 'Blue', 200: 'Red'})
+
+# Format of date_added in the database, always with microseconds so every row parses the same way
+DATE_ADDED_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Column types of the blacklist dataframe, pyarrow backed strings hash and compare faster than objects
+BLACKLIST_DTYPES = {
+    'summoner_id': 'string[pyarrow]',
+    'summoner_name': 'string[pyarrow]',
+    'reason': 'string[pyarrow]',
+    'tagline': 'category'
+}
+
+class SummonerNotFound(Exception):
+    """Raised when no account exists for a Riot ID in the manager's region"""
+
+def participant_riot_id(participant):
+    """Get the name and tagline of a live game participant
+    
+    Parameters:
+        participant: Spectator participant dict
+        
+    Returns:
+        tuple: (summoner_name, tagline)
+    """
+    riot_id = participant.get('riotId')
+    if isinstance(riot_id, str):
+        # Spectator v5 sends the Riot ID as "name#tag"
+        summoner_name, _, tagline = riot_id.partition('#')
+        return summoner_name, tagline
+    if isinstance(riot_id, dict):
+        return riot_id.get('gameName', 'Unknown Player'), riot_id.get('tagLine', '')
+    
+    # Try other fields that might contain the name
+    summoner_name = participant.get('summonerName') or participant.get('name') or participant.get('riotIdGameName') or 'Unknown Player'
+    return summoner_name, participant.get('riotIdTagline', '')
+
+class RiotRateLimiter(RateLimiter):
+    """Token bucket rate limiter for Riot API calls, safe to share between threads
+    
+    Riot enforces application limits per routing region, so every region
+    has its own bucket. Each call reserves a slot in each (max_calls, seconds)
+    window of its region and waits until one is free, so bursts from
+    auto-refresh and bulk match fetches are smoothed out instead of running
+    into 429s. The windows start at the given limits and follow the
+    X-App-Rate-Limit header once Riot reports the key's actual limits.
+    Method limits and Retry-After of 429 responses are still honored through
+    riotwatcher's BasicRateLimiter.
+    """
+    
+    def __init__(self, limits=((20, 1), (100, 120))):
+        """Create a rate limiter
+        
+        Parameters:
+            limits: Initial (max_calls, seconds) pairs per region, the defaults match a development API key
+        """
+        self.limits = tuple(limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._basic_limiter = BasicRateLimiter()
+    
+    def _bucket(self, region):
+        """Get the (max_calls, seconds, calls) windows of a region"""
+        bucket = self._buckets.get(region)
+        if bucket is None:
+            bucket = self._buckets[region] = [(max_calls, seconds, deque()) for max_calls, seconds in self.limits]
+        return bucket
+    
+    def wait_until(self, region, endpoint_name, method_name):
+        """Reserve a slot for a call, returning when it may be made or None to call right away"""
+        with self._lock:
+            bucket = self._bucket(region)
+            now = time.monotonic()
+            start = now
+            for max_calls, seconds, calls in bucket:
+                # Drop calls that have left the window
+                while calls and calls[0] <= now - seconds:
+                    calls.popleft()
+                if len(calls) >= max_calls:
+                    start = max(start, calls[-max_calls] + seconds)
+                if calls:
+                    start = max(start, calls[-1])
+            
+            for _, _, calls in bucket:
+                calls.append(start)
+            
+            wait_until = self._basic_limiter.wait_until(region, endpoint_name, method_name)
+        
+        if start > now:
+            bucket_wait = datetime.now() + timedelta(seconds=start - now)
+            wait_until = max(wait_until, bucket_wait) if wait_until else bucket_wait
+        return wait_until
+    
+    def record_response(self, region, endpoint_name, method_name, status, headers):
+        """Update the limits of a region from the headers of a response"""
+        with self._lock:
+            self._basic_limiter.record_response(region, endpoint_name, method_name, status, headers)
+            
+            # The header lists the key's application limits as "max_calls:seconds,..."
+            header = headers.get("X-App-Rate-Limit")
+            if not header:
+                return
+            try:
+                limits = tuple(tuple(int(part) for part in limit.split(":")) for limit in header.split(","))
+            except ValueError:
+                return
+            
+            bucket = self._bucket(region)
+            if limits != tuple((max_calls, seconds) for max_calls, seconds, _ in bucket):
+                # Keep the calls already made in windows of the same length
+                calls_by_seconds = {seconds: calls for _, seconds, calls in bucket}
+                self._buckets[region] = [
+                    (max_calls, seconds, calls_by_seconds.get(seconds, deque()))
+                    for max_calls, seconds in limits
+                ]
+
+class BlacklistStore:
+    """Blacklist and PUUID cache database, shared by every manager that uses the same file
+    
+    Managers for several regions can be alive at once, keeping the ID index and
+    version here means a change made through one manager is seen by all of them.
+    """
+    def __init__(self, db_path="blacklist.db", legacy_blacklist_file="blacklist.csv",
+                 legacy_puuid_cache_file="puuid_cache.json"):
+        self.db_path = db_path
+        self.legacy_blacklist_file = legacy_blacklist_file
+        self.legacy_puuid_cache_file = legacy_puuid_cache_file
+        
+        # Incremented on every blacklist change so callers can cheaply invalidate caches
+        self.version = 0
+        
+        # Open the blacklist database, the connection is shared between threads
+        # and the lock also guards the index, the dataframe and the version
+        self._db_lock = threading.RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS blacklist ("
+                "summoner_id TEXT PRIMARY KEY, summoner_name TEXT, reason TEXT, date_added TEXT, tagline TEXT)"
+            )
+            self.conn.execute("CREATE TABLE IF NOT EXISTS puuid_cache (cache_key TEXT PRIMARY KEY, puuid TEXT)")
+            # Names of the one-time migrations already applied to this database
+            self.conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+        self._import_legacy_blacklist()
+        
+        # The dataframe is loaded on demand by get_blacklist
+        self.blacklist_df = None
+        
+        # Index blacklisted IDs and their details for fast lookups
+        self._rebuild_index()
+        
+        # Load the PUUID cache, new entries are written one row at a time
+        self._import_legacy_puuid_cache()
+        with self._db_lock:
+            self.puuid_cache = dict(self.conn.execute("SELECT cache_key, puuid FROM puuid_cache"))
+    
+    def _is_migrated(self, name):
+        """Check if a one-time migration was already applied to the database, call with the lock held"""
+        return self.conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone() is not None
+    
+    def _import_legacy_blacklist(self):
+        """Import the blacklist CSV used by older versions, once per database"""
+        if not os.path.exists(self.legacy_blacklist_file):
+            return
+        
+        with self._db_lock:
+            if self._is_migrated('legacy_blacklist'):
+                return
+            
+            # A database that already has players was set up before the import was recorded
+            if self.conn.execute("SELECT 1 FROM blacklist LIMIT 1").fetchone():
+                with self.conn:
+                    self.conn.execute("INSERT INTO migrations (name) VALUES ('legacy_blacklist')")
+                return
+            
+            try:
+                legacy_df = pd.read_csv(self.legacy_blacklist_file, dtype=str)
+                
+                # Older versions wrote dates in whatever format str() produced, store them in one format
+                if 'date_added' in legacy_df.columns:
+                    dates = pd.to_datetime(legacy_df['date_added'], format='mixed', errors='coerce')
+                    legacy_df['date_added'] = dates.dt.strftime(DATE_ADDED_FORMAT)
+                
+                rows = [
+                    (row.get('summoner_id'), row.get('summoner_name'), row.get('reason'),
+                     row.get('date_added'), row.get('tagline'))
+                    for row in legacy_df.astype(object).where(legacy_df.notna(), None).to_dict('records')
+                ]
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO blacklist (summoner_id, summoner_name, reason, date_added, tagline) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    # Recorded in the same transaction, so emptying the blacklist later doesn't bring the CSV back
+                    self.conn.execute("INSERT INTO migrations (name) VALUES ('legacy_blacklist')")
+                logger.info("Imported %d entries from %s", len(rows), self.legacy_blacklist_file)
+            except Exception as e:
+                logger.error("Error importing legacy blacklist: %s", e)
+    
+    def _rebuild_index(self):
+        """Rebuild the blacklist index from the database
+        
+        The index maps each blacklisted summoner ID to a (reason, date_added, tagline) tuple.
+        """
+        with self._db_lock:
+            self._info_by_id = {
+                summoner_id: (reason, date_added, tagline)
+                for summoner_id, reason, date_added, tagline
+                in self.conn.execute("SELECT summoner_id, reason, date_added, tagline FROM blacklist")
+            }
+    
+    def _blacklist_changed(self):
+        """Invalidate the loaded dataframe and bump the version after a change"""
+        self.blacklist_df = None
+        self.version += 1
+    
+    def _import_legacy_puuid_cache(self):
+        """Import the PUUID cache JSON file used by older versions, once per database"""
+        if not os.path.exists(self.legacy_puuid_cache_file):
+            return
+        
+        with self._db_lock:
+            if self._is_migrated('legacy_puuid_cache'):
+                return
+            
+            try:
+                with open(self.legacy_puuid_cache_file, 'r') as f:
+                    legacy_cache = json.load(f)
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO puuid_cache (cache_key, puuid) VALUES (?, ?)",
+                        legacy_cache.items()
+                    )
+                    self.conn.execute("INSERT INTO migrations (name) VALUES ('legacy_puuid_cache')")
+            except Exception as e:
+                logger.error("Error importing legacy PUUID cache: %s", e)
+    
+    def save_puuid(self, cache_key, puuid):
+        """Cache a PUUID in memory and persist just that entry"""
+        self.puuid_cache[cache_key] = puuid
+        with self._db_lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO puuid_cache (cache_key, puuid) VALUES (?, ?)", (cache_key, puuid))
+    
+    def add_to_blacklist(self, summoner_id, summoner_name, reason="", tagline=""):
+        """Add a player to the blacklist"""
+        try:
+            date_added = datetime.now().strftime(DATE_ADDED_FORMAT)
+            with self._db_lock, self.conn:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO blacklist (summoner_id, summoner_name, reason, date_added, tagline) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (str(summoner_id), summoner_name, reason, date_added, tagline)
+                )
+                if cursor.rowcount:
+                    self._info_by_id[str(summoner_id)] = (reason, date_added, tagline)
+                    self._blacklist_changed()
+            
+            # Nothing inserted means the player is already blacklisted
+            if cursor.rowcount == 0:
+                logger.info("Player %s is already blacklisted", summoner_name)
+                return False, "Player is already in your blacklist"
+            
+            logger.info("Added %s to blacklist", summoner_name)
+            return True, f"Added {summoner_name} to blacklist"
+        except Exception as e:
+            logger.error("Error adding to blacklist: %s", e)
+            return False, f"Error: {str(e)}"
+    
+    def bulk_apply(self, ops):
+        """Apply several blacklist changes in order in a single transaction
+        
+        Parameters:
+            ops: List of ('add', summoner_id, summoner_name, tagline, reason) or ('remove', summoner_id)
+            
+        Returns:
+            tuple: (success, message)
+        """
+        try:
+            applied = 0
+            with self._db_lock, self.conn:
+                for op in ops:
+                    if op[0] == 'add':
+                        _, summoner_id, summoner_name, tagline, reason = op
+                        cursor = self.conn.execute(
+                            "INSERT OR IGNORE INTO blacklist (summoner_id, summoner_name, reason, date_added, tagline) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            (str(summoner_id), summoner_name, reason, datetime.now().strftime(DATE_ADDED_FORMAT), tagline)
+                        )
+                    elif op[0] == 'remove':
+                        _, summoner_id = op
+                        cursor = self.conn.execute("DELETE FROM blacklist WHERE summoner_id = ?", (str(summoner_id),))
+                    else:
+                        continue
+                    applied += cursor.rowcount
+            
+                if applied:
+                    self._rebuild_index()
+                    self._blacklist_changed()
+            
+            logger.info("Applied %d of %d blacklist changes", applied, len(ops))
+            return True, f"Applied {applied} blacklist changes"
+        except Exception as e:
+            logger.error("Error applying blacklist changes: %s", e)
+            return False, f"Error: {str(e)}"
+    
+    def remove_from_blacklist(self, summoner_id):
+        """Remove a player from the blacklist"""
+        try:
+            with self._db_lock, self.conn:
+                cursor = self.conn.execute("DELETE FROM blacklist WHERE summoner_id = ?", (str(summoner_id),))
+                if cursor.rowcount:
+                    self._info_by_id.pop(str(summoner_id), None)
+                    self._blacklist_changed()
+            
+            if cursor.rowcount == 0:
+                logger.info("Player with ID %s is not in blacklist", summoner_id)
+                return False
+            
+            logger.info("Removed player with ID %s from blacklist", summoner_id)
+            return True
+        except Exception as e:
+            logger.error("Error removing from blacklist: %s", e)
+            return False
+    
+    def get_blacklist(self):
+        """Get the entire blacklist"""
+        # Load the blacklist from the database if it changed since the last call
+        with self._db_lock:
+            if self.blacklist_df is None:
+                self.blacklist_df = pd.read_sql(
+                    "SELECT summoner_id, summoner_name, reason, date_added, tagline FROM blacklist ORDER BY date_added",
+                    self.conn,
+                    parse_dates={'date_added': {'format': 'ISO8601'}},
+                    dtype=BLACKLIST_DTYPES
+                )
+            return self.blacklist_df
+    
+    def is_blacklisted(self, summoner_id):
+        """Check if a player is blacklisted"""
+        return str(summoner_id) in self._info_by_id
+    
+    def get_blacklisted_ids(self):
+        """Get the IDs of all blacklisted players without loading the blacklist dataframe"""
+        with self._db_lock:
+            return frozenset(self._info_by_id)
+    
+    def get_blacklist_info(self, summoner_ids):
+        """Get the (reason, date_added, tagline) of the blacklisted players among some IDs
+        
+        Parameters:
+            summoner_ids: Summoner IDs to look up
+            
+        Returns:
+            dict: Summoner ID to (reason, date_added, tagline) for the blacklisted ones
+        """
+        with self._db_lock:
+            info_by_id = self._info_by_id
+            return {summoner_id: info_by_id[summoner_id] for summoner_id in summoner_ids & info_by_id.keys()}
+
+# One store per database file, shared by every manager in the process
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_blacklist_store(db_path="blacklist.db"):
+    """Get the shared store of a database file, opening it on first use
+    
+    Parameters:
+        db_path: Path of the SQLite database
+        
+    Returns:
+        BlacklistStore: The store used by every manager for this file
+    """
+    key = os.path.abspath(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = BlacklistStore(db_path)
+        return store
 
 class BlacklistManager:
-    def __init__(self, api_key=None, region="na1"):
+    def __init__(self, api_key=None, region="na1", rate_limiter=None, store=None):
         self.api_key = api_key
         self.region = region.lower()
         
         # Map region to platform and continent
-        self.region_to_platform = {
-            "na1": "na1", "euw1": "euw1", "eun1": "eun1", "kr": "kr",
-            "br1": "br1", "jp1": "jp1", "la1": "la1", "la2": "la2",
-            "oc1": "oc1", "tr1": "tr1", "ru": "ru"
-        }
+        self.platform = REGION_TO_PLATFORM.get(self.region, "na1")
+        self.continent = REGION_TO_CONTINENT.get(self.region, "americas")
+        self.default_tagline = REGION_TO_TAGLINE.get(self.region, "NA1")
         
-        self.region_to_continent = {
-            "na1": "americas", "br1": "americas", "la1": "americas", "la2": "americas",
-            "euw1": "europe", "eun1": "europe", "tr1": "europe", "ru": "europe",
-            "kr": "asia", "jp1": "asia", "oc1": "sea"
-        }
+        # Blacklist and PUUID cache, shared with the managers of the other regions
+        self.store = store or get_blacklist_store()
+        self.puuid_cache = self.store.puuid_cache
         
-        self.platform = self.region_to_platform.get(self.region, "na1")
-        self.continent = self.region_to_continent.get(self.region, "americas")
+        # Riot API calls currently in flight, keyed by endpoint URL
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
         
-        self.blacklist_file = "blacklist.csv"
-        self.puuid_cache_file = "puuid_cache.json"
+        # Seconds to wait for a Riot API response before giving up
+        self.request_timeout = 10
         
-        # Initialize Riot Watcher
+        # Initialize Riot Watcher, it keeps one HTTP session alive so warm calls reuse connections
         if api_key:
-            self.watcher = LolWatcher(api_key)
+            self.watcher = LolWatcher(
+                api_key,
+                timeout=self.request_timeout,
+                rate_limiter=rate_limiter or RiotRateLimiter()
+            )
         else:
             self.watcher = None
             
-        # Create blacklist file if it doesn't exist
-        if not os.path.exists(self.blacklist_file):
-            # Initialize empty blacklist dataframe
-            self.blacklist_df = pd.DataFrame(columns=['summoner_id', 'summoner_name', 'reason', 'date_added', 'tagline'])
-            # Save to file
-            self.blacklist_df.to_csv(self.blacklist_file, index=False)
-        else:
-            # Load existing blacklist
-            try:
-                self.blacklist_df = pd.read_csv(self.blacklist_file)
-                print(f"Loaded blacklist with {len(self.blacklist_df)} entries")
-            except Exception as e:
-                print(f"Error loading blacklist: {str(e)}")
-                self.blacklist_df = pd.DataFrame(columns=['summoner_id', 'summoner_name', 'reason', 'date_added', 'tagline'])
-        
-        # Load or create PUUID cache
-        if os.path.exists(self.puuid_cache_file):
-            try:
-                with open(self.puuid_cache_file, 'r') as f:
-                    self.puuid_cache = json.load(f)
-            except:
-                self.puuid_cache = {}
-        else:
-            self.puuid_cache = {}
-    
-    def _save_puuid_cache(self):
-        """Save the PUUID cache to file"""
-        with open(self.puuid_cache_file, 'w') as f:
-            json.dump(self.puuid_cache, f)
-    
     def get_summoner(self, summoner_name, tagline):
         """Get summoner by name and tagline"""
         try:
@@ -81,18 +456,13 @@ class BlacklistManager:
             
             # Default to region's default tagline if not provided
             if not tagline:
-                region_to_tagline = {
-                    "na1": "NA1", "euw1": "EUW1", "eun1": "EUN1", "kr": "KR",
-                    "br1": "BR1", "jp1": "JP1", "la1": "LA1", "la2": "LA2",
-                    "oc1": "OC1", "tr1": "TR1", "ru": "RU"
-                }
-                tagline = region_to_tagline.get(self.region, "NA1")
+                tagline = self.default_tagline
             
             # Check if summoner is in cache
             cache_key = f"{summoner_name.lower()}#{tagline.lower()}"
             if cache_key in self.puuid_cache:
                 puuid = self.puuid_cache[cache_key]
-                print(f"Using cached PUUID for {summoner_name}#{tagline}: {puuid}")
+                logger.debug("Using cached PUUID for %s#%s: %s", summoner_name, tagline, puuid)
                 
                 # Get summoner by PUUID using Riot API
                 summoner = self.watcher.summoner.by_puuid(self.platform, puuid)
@@ -102,19 +472,19 @@ class BlacklistManager:
                 summoner['gameName'] = summoner_name
                 summoner['name'] = summoner_name  # Ensure name field exists for backward compatibility
                 
-                print(f"Summoner data: {summoner.keys()}")
+                logger.debug("Summoner data: %s", summoner.keys())
                 return summoner
             
             # Use Riot account-v1 API to get account info
             endpoint = f"https://{self.continent}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{summoner_name}/{tagline}"
-            print(f"Calling endpoint: {endpoint}")
+            logger.debug("Calling endpoint: %s", endpoint)
             
             account = self.watcher.account.by_riot_id(self.continent, summoner_name, tagline)
-            print(f"Found account: {account}")
+            logger.debug("Found account: %s", account)
             
             # Get summoner by PUUID
             endpoint = f"https://{self.platform}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{account['puuid']}"
-            print(f"Calling endpoint: {endpoint}")
+            logger.debug("Calling endpoint: %s", endpoint)
             
             summoner = self.watcher.summoner.by_puuid(self.platform, account['puuid'])
             
@@ -124,18 +494,19 @@ class BlacklistManager:
             summoner['name'] = summoner_name  # Ensure name field exists for backward compatibility
             
             # Cache the PUUID for future use
-            self.puuid_cache[cache_key] = account['puuid']
-            self._save_puuid_cache()
-            print(f"Cached PUUID for {summoner_name}#{tagline}: {account['puuid']}")
+            self.store.save_puuid(cache_key, account['puuid'])
+            logger.debug("Cached PUUID for %s#%s: %s", summoner_name, tagline, account['puuid'])
             
-            print(f"Summoner data: {summoner.keys()}")
+            logger.debug("Summoner data: %s", summoner.keys())
             return summoner
             
         except ApiError as e:
-            print(f"API Error: {e.response.status_code}")
+            if e.response.status_code == 404:
+                raise SummonerNotFound(f"Could not find summoner '{summoner_name}#{tagline}' in region {self.region}")
+            logger.warning("API Error: %s", e.response.status_code)
             raise Exception(f"Could not find summoner '{summoner_name}#{tagline}' in region {self.region}: {str(e)}")
         except Exception as e:
-            print(f"Error getting summoner: {e}")
+            logger.error("Error getting summoner: %s", e)
             raise Exception(f"Could not find summoner '{summoner_name}#{tagline}' in region {self.region}: {str(e)}")
     
     def get_match_history(self, summoner, limit=5, start=0):
@@ -143,7 +514,7 @@ class BlacklistManager:
         try:
             puuid = summoner['puuid']
             endpoint = f"https://{self.continent}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
-            print(f"Calling endpoint: {endpoint}?start={start}&count={limit}")
+            logger.debug("Calling endpoint: %s?start=%s&count=%s", endpoint, start, limit)
             
             # Get match IDs
             match_ids = self.watcher.match.matchlist_by_puuid(
@@ -153,56 +524,78 @@ class BlacklistManager:
                 count=limit
             )
             
-            print(f"Retrieved {len(match_ids)} matches: {match_ids}")
+            logger.debug("Retrieved %d matches: %s", len(match_ids), match_ids)
             return match_ids
             
         except ApiError as e:
-            print(f"API Error: {e.response.status_code}")
+            logger.warning("API Error: %s", e.response.status_code)
             raise Exception(f"Error retrieving match history: {str(e)}")
         except Exception as e:
-            print(f"Match history error: {str(e)}")
+            logger.error("Match history error: %s", e)
             raise Exception(f"Error retrieving match history: {str(e)}")
     
+    def _coalesced(self, endpoint, fetch):
+        """Call fetch, or wait for the result of a call to the same endpoint already in flight
+        
+        Parameters:
+            endpoint: URL of the call, identical calls share one request
+            fetch: Function making the API call
+            
+        Returns:
+            The result of fetch, shared with every caller waiting on it
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[endpoint] = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            # Resolve the future even on KeyboardInterrupt and the like, so waiters never hang
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[endpoint]
+    
     def get_match_details(self, match_id):
         """Get match details by match ID"""
         try:
             endpoint = f"https://{self.continent}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-            print(f"Calling endpoint: {endpoint}")
+            logger.debug("Calling endpoint: %s", endpoint)
             
             # Get match details
-            match = self.watcher.match.by_id(region=self.continent, match_id=match_id)
-            
-            # Extract participant information
-            participants = []
-            for participant in match['info']['participants']:
-                # Extract summoner name - make sure it's not empty
-                summoner_name = participant.get('summonerName', 'Unknown')
-                if not summoner_name or summoner_name == 'Unknown':
-                    # Try alternate fields that might contain the name
-                    summoner_name = participant.get('riotIdGameName', 
-                                    participant.get('playerName', 
-                                    participant.get('name', 'Unknown Player')))
-                
-                # Create participant info with all required fields
-                participant_info = {
-                    'summoner_id': participant.get('summonerId', ''),
-                    'summoner_name': summoner_name,  # Use the extracted name
-                    'champion': participant.get('championName', participant.get('championId', 'Unknown')),
-                    'team': 'Blue' if participant['teamId'] == 100 else 'Red',
-                    'tagline': participant.get('riotIdTagline', '')
+            match = self._coalesced(endpoint, lambda: self.watcher.match.by_id(region=self.continent, match_id=match_id))
+            
+            # Extract participant information, falling back to alternate fields when the name is empty
+            participants = [
+                {
+                    'summoner_id': p.get('summonerId', ''),
+                    'summoner_name': (p.get('summonerName') or p.get('riotIdGameName')
+                                      or p.get('playerName') or p.get('name') or 'Unknown Player'),
+                    'champion': p.get('championName') or p.get('championId') or 'Unknown',
+                    'team': TEAM_NAMES.get(p['teamId'], 'Red'),
+                    'tagline': p.get('riotIdTagline', '')
                 }
-                participants.append(participant_info)
+                for p in match['info']['participants']
+            ]
             
-            print(f"Retrieved details for match {match_id} with {len(participants)} participants")
-            print(f"Participant names: {[p['summoner_name'] for p in participants]}")
+            logger.debug("Retrieved details for match %s with %d participants", match_id, len(participants))
             
             return match, participants
             
         except ApiError as e:
-            print(f"API Error: {e.response.status_code}")
+            logger.warning("API Error: %s", e.response.status_code)
             raise Exception(f"Error retrieving match details: {str(e)}")
         except Exception as e:
-            print(f"Match details error for {match_id}: {str(e)}")
+            logger.error("Match details error for %s: %s", match_id, e)
             raise Exception(f"Error retrieving match details: {str(e)}")
     
     def get_current_match(self, summoner):
@@ -211,160 +604,102 @@ class BlacklistManager:
             # Use PUUID to get current match (v5 API uses PUUID instead of summoner ID)
             puuid = summoner['puuid']
             endpoint = f"https://{self.platform}.api.riotgames.com/lol/spectator/v5/active-games/by-summoner/{puuid}"
-            print(f"Calling endpoint: {endpoint}")
+            logger.debug("Calling endpoint: %s", endpoint)
             
-            # Call the by_summoner method with PUUID
-            current_match = self.watcher.spectator.by_summoner(self.platform, puuid)
+            # Call the by_summoner method with PUUID, sharing the call with other viewers of this summoner
+            current_match = self._coalesced(endpoint, lambda: self.watcher.spectator.by_summoner(self.platform, puuid))
             return current_match
         except ApiError as e:
             if e.response.status_code == 404:
-                print(f"Summoner is not in an active game")
+                logger.debug("Summoner is not in an active game")
                 return None
             elif e.response.status_code == 400:
-                print(f"User is currently not in a game.")
+                logger.debug("User is currently not in a game.")
                 return None
             else:
-                print(f"API Error: {e.response.status_code}")
+                logger.warning("API Error: %s", e.response.status_code)
                 return None
         except Exception as e:
-            print(f"Error getting current match: {e}")
+            logger.error("Error getting current match: %s", e)
             return None
     
+    @property
+    def version(self):
+        """Version of the shared blacklist, incremented on every change"""
+        return self.store.version
+    
     def add_to_blacklist(self, summoner_id, summoner_name, reason="", tagline=""):
         """Add a player to the blacklist"""
-        try:
-            # First check if player is already blacklisted
-            if self.is_blacklisted(summoner_id):
-                print(f"Player {summoner_name} is already blacklisted")
-                return False, "Player is already in your blacklist"
-            
-            # Create a new row with the blacklist data
-            new_row = {
-                'summoner_id': summoner_id,
-                'summoner_name': summoner_name,
-                'reason': reason,
-                'date_added': pd.Timestamp.now(),
-                'tagline': tagline
-            }
-            
-            # Add the new row to the dataframe
-            self.blacklist_df = pd.concat([self.blacklist_df, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # Save the updated blacklist
-            self._save_blacklist()
-            
-            print(f"Added {summoner_name} to blacklist")
-            return True, f"Added {summoner_name} to blacklist"
-        except Exception as e:
-            print(f"Error adding to blacklist: {str(e)}")
-            return False, f"Error: {str(e)}"
+        return self.store.add_to_blacklist(summoner_id, summoner_name, reason, tagline)
+    
+    def bulk_apply(self, ops):
+        """Apply several blacklist changes in order in a single transaction"""
+        return self.store.bulk_apply(ops)
     
     def remove_from_blacklist(self, summoner_id):
         """Remove a player from the blacklist"""
-        try:
-            # Get current blacklist
-            if not self.is_blacklisted(summoner_id):
-                print(f"Player with ID {summoner_id} is not in blacklist")
-                return False
-            
-            # Use the in-memory dataframe
-            self.blacklist_df = self.blacklist_df[self.blacklist_df['summoner_id'] != summoner_id]
-            
-            # Save changes to file
-            success = self._save_blacklist()
-            if success:
-                print(f"Removed player with ID {summoner_id} from blacklist")
-            return success
-        except Exception as e:
-            print(f"Error removing from blacklist: {str(e)}")
-            return False
+        return self.store.remove_from_blacklist(summoner_id)
     
     def get_blacklist(self):
         """Get the entire blacklist"""
-        # Make sure we have the most up-to-date blacklist data
-        if not hasattr(self, 'blacklist_df') or self.blacklist_df is None:
-            if not os.path.exists(self.blacklist_file) or os.stat(self.blacklist_file).st_size == 0:
-                self.blacklist_df = pd.DataFrame(columns=['summoner_id', 'summoner_name', 'reason', 'date_added', 'tagline'])
-            else:
-                self.blacklist_df = pd.read_csv(self.blacklist_file)
-        
-        return self.blacklist_df
+        return self.store.get_blacklist()
     
     def is_blacklisted(self, summoner_id):
         """Check if a player is blacklisted"""
-        # Get current blacklist
-        blacklist = self.get_blacklist()
-        
-        # Check if the summoner ID is in the blacklist
-        is_in_blacklist = summoner_id in blacklist['summoner_id'].values
-        return is_in_blacklist
+        return self.store.is_blacklisted(summoner_id)
+    
+    def get_blacklisted_ids(self):
+        """Get the IDs of all blacklisted players without loading the blacklist dataframe"""
+        return self.store.get_blacklisted_ids()
     
-    def check_current_match_for_blacklisted(self, summoner):
-        """Check if any players in current match are blacklisted"""
-        current_match = self.get_current_match(summoner)
+    def check_current_match_for_blacklisted(self, summoner, current_match=None):
+        """Check if any players in current match are blacklisted
+        
+        Parameters:
+            summoner: Summoner data of the player to check
+            current_match: Already retrieved current match, fetched if not given
+        """
+        if current_match is None:
+            current_match = self.get_current_match(summoner)
         if not current_match:
             return []
         
-        blacklisted_players = []
-        blacklist = self.get_blacklist()
-        
-        # Debug: print participant fields
+        # Debug: log participant fields
         if 'participants' in current_match and len(current_match['participants']) > 0:
             first_player = current_match['participants'][0]
-            print(f"Live match participant fields: {list(first_player.keys())}")
+            logger.debug("Live match participant fields: %s", list(first_player.keys()))
+        
+        # Map participants by summoner ID - spectator v5 uses different field names
+        participant_map = {
+            participant.get('summonerId', participant.get('id', '')): participant
+            for participant in current_match.get('participants', [])
+        }
         
-        # Check all participants
-        for participant in current_match['participants']:
-            # Extract summoner ID - spectator v5 uses different field names
-            summoner_id = participant.get('summonerId', participant.get('id', ''))
+        # Find blacklisted participants with a single set intersection
+        info_by_id = self.store.get_blacklist_info(participant_map.keys())
+        
+        blacklisted_players = []
+        for summoner_id, participant in participant_map.items():
+            if summoner_id not in info_by_id:
+                continue
+            reason, date_added, blacklist_tagline = info_by_id[summoner_id]
             
             # Extract summoner name - spectator v5 uses riotId structure
-            if 'riotId' in participant:
-                # v5 API has riotId object
-                riot_id = participant.get('riotId', {})
-                summoner_name = riot_id.get('gameName', 'Unknown Player')
-                tagline = riot_id.get('tagLine', '')
-            else:
-                # Try other fields that might contain the name
-                summoner_name = participant.get('summonerName', 
-                              participant.get('name', 
-                              participant.get('riotIdGameName', 'Unknown Player')))
-                tagline = participant.get('riotIdTagline', '')
-            
-            if summoner_id in blacklist['summoner_id'].values:
-                blacklisted_info = blacklist[blacklist['summoner_id'] == summoner_id].iloc[0]
-                
-                # Get champion information - use name if available, otherwise ID
-                champion = participant.get('championName', participant.get('championId', 'Unknown'))
-                
-                # Get tagline from either participant or blacklist
-                player_tagline = tagline or blacklisted_info.get('tagline', '')
-                tag_display = f"#{player_tagline}" if player_tagline else ""
-                
-                blacklisted_players.append({
-                    'summoner_id': summoner_id,
-                    'summoner_name': f"{summoner_name}{tag_display}",
-                    'champion': champion,
-                    'reason': blacklisted_info['reason'],
-                    'date_added': blacklisted_info['date_added']
-                })
-                
+            summoner_name, tagline = participant_riot_id(participant)
+            
+            # Get champion information - use name if available, otherwise ID
+            champion = participant.get('championName', participant.get('championId', 'Unknown'))
+            
+            # Get tagline from either participant or blacklist
+            player_tagline = tagline or blacklist_tagline
+            tag_display = f"#{player_tagline}" if player_tagline else ""
+            
+            blacklisted_players.append({
+                'summoner_id': summoner_id,
+                'summoner_name': f"{summoner_name}{tag_display}",
+                'champion': champion,
+                'reason': reason,
+                'date_added': date_added
+            })
+        
         return blacklisted_players
-    
-    def _save_blacklist(self):
-        """Save the blacklist dataframe to file"""
-        try:
-            # Make sure the blacklist_df attribute exists, load it from file if not
-            if not hasattr(self, 'blacklist_df') or self.blacklist_df is None:
-                if os.path.exists(self.blacklist_file):
-                    self.blacklist_df = pd.read_csv(self.blacklist_file)
-                else:
-                    self.blacklist_df = pd.DataFrame(columns=['summoner_id', 'summoner_name', 'reason', 'date_added', 'tagline'])
-            
-            # Save the dataframe to CSV
-            self.blacklist_df.to_csv(self.blacklist_file, index=False)
-            print(f"Blacklist saved to {self.blacklist_file}")
-            return True
-        except Exception as e:
-            print(f"Error saving blacklist: {str(e)}")
-            return False 
\ No newline at end of file
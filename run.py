@@ -1,58 +1,139 @@
 #!/usr/bin/env python3
-import subprocess
+import gc
 import sys
 import os
-import webbrowser
-from time import sleep
+
+# Messages shown before starting the app
+WELCOME_MESSAGE = (
+    "\nWelcome to the League of Legends Blacklist System!\n"
+    "Before we get started, you'll need a Riot API key.\n"
+    "You can get one at: https://developer.riotgames.com/\n"
+    "\nOnce you have your API key, you'll need to enter it in the app.\n"
+    "The app will save your API key locally so you don't need to enter it each time.\n"
+)
+CONFIG_FOUND_MESSAGE = "\nConfig file found! Your saved settings will be loaded automatically.\n"
+STARTING_MESSAGE = (
+    "\nStarting the Streamlit app...\n"
+    "The app will open in your browser shortly.\n"
+)
+
+# Remembers that the dependencies were satisfied, so warm launches skip the check
+DEPS_MARKER_FILE = ".deps_ok"
+
+def dependencies_key():
+    """Identify the requirements file and interpreter the dependencies were checked for"""
+    stat = os.stat("requirements.txt")
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{sys.prefix}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+def normalize_name(name):
+    """Normalize a distribution name so differently spelled names compare equal"""
+    import re
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def required_distributions():
+    """Get the normalized names of the distributions listed in requirements.txt"""
+    import re
+    names = set()
+    with open("requirements.txt", "r") as f:
+        for line in f:
+            # Skip comments, blank lines and pip options, and drop version specifiers and extras
+            match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", line.split("#", 1)[0].strip())
+            if match:
+                names.add(normalize_name(match.group(0)))
+    return names
+
+def check_dependencies():
+    """Install missing dependencies, unless they were already checked for this requirements file"""
+    key = dependencies_key()
+    try:
+        with open(DEPS_MARKER_FILE, "r") as f:
+            if f.readline().strip() == key:
+                return
+    except FileNotFoundError:
+        pass
+    
+    # Collect the installed distributions in one pass, without importing any of them
+    from importlib.metadata import distributions
+    installed = {normalize_name(d.metadata["Name"]) for d in distributions() if d.metadata["Name"]}
+    missing = required_distributions() - installed
+    if missing:
+        print("Some dependencies are missing. Installing required packages...")
+        import subprocess
+        # Prefer wheels over building from source, pip reuses them from its cache on reinstalls.
+        # Skip byte-compiling everything installed, modules are compiled when first imported
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--prefer-binary",
+            "--no-compile",
+            "--disable-pip-version-check",
+            "-r", "requirements.txt"
+        ])
+    
+    with open(DEPS_MARKER_FILE, "w") as f:
+        f.write(key + "\n")
+
+def compile_app_modules():
+    """Byte-compile the modules next to this script, skipping the ones that are up to date"""
+    import compileall
+    compileall.compile_dir(
+        os.path.dirname(os.path.abspath(__file__)),
+        maxlevels=0,
+        quiet=1,
+        optimize=streamlit_optimize_level()
+    )
+
+def streamlit_optimize_level():
+    """Get the optimization level Streamlit runs with, -OO unless LEAGUE_NO_OPTIMIZE is set"""
+    return 0 if os.environ.get("LEAGUE_NO_OPTIMIZE") else 2
 
 def main():
+    # The launcher is short-lived and replaced by Streamlit, so garbage collection passes are wasted work
+    gc.disable()
+    
     print("=== League of Legends Blacklist System ===")
     
-    # Check for dependencies
-    try:
-        import streamlit
-        import pandas
-        import cassiopeia
-    except ImportError:
-        print("Some dependencies are missing. Installing required packages...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    # Byte-compile the app's modules so the first page load imports them from warm .pyc files,
+    # in the background while the dependencies are checked
+    import threading
+    compile_thread = threading.Thread(target=compile_app_modules, daemon=True)
+    compile_thread.start()
     
-    # Checking if config.json exists
-    config_exists = os.path.exists("config.json")
+    # Check for dependencies, unless the environment is known to be set up already
+    if not (os.environ.get("LEAGUE_SKIP_DEPCHECK") or os.path.exists("/.dockerenv")):
+        check_dependencies()
     
-    if not config_exists:
-        print("\nWelcome to the League of Legends Blacklist System!")
-        print("Before we get started, you'll need a Riot API key.")
-        print("You can get one at: https://developer.riotgames.com/")
-        print("\nOnce you have your API key, you'll need to enter it in the app.")
-        print("The app will save your API key locally so you don't need to enter it each time.")
-    else:
-        print("\nConfig file found! Your saved settings will be loaded automatically.")
+    compile_thread.join()
     
-    print("\nStarting the Streamlit app...")
-    print("The app will open in your browser shortly.")
+    # Checking if config.json exists
+    try:
+        os.stat("config.json")
+        config_exists = True
+    except FileNotFoundError:
+        config_exists = False
     
-    # Open the browser
-    sleep(2)  # Brief pause
-    webbrowser.open('http://localhost:8501')
+    # Write everything at once, and flush since the buffer doesn't survive the exec into Streamlit
+    sys.stdout.write((CONFIG_FOUND_MESSAGE if config_exists else WELCOME_MESSAGE) + STARTING_MESSAGE)
+    sys.stdout.flush()
     
-    # Start the Streamlit app
+    # Start the Streamlit app, it opens the browser itself as soon as the server is listening
     run_streamlit()
 
 def run_streamlit():
-    """Run the Streamlit app with auto-reload enabled"""
+    """Run the Streamlit app with auto-reload enabled
+    
+    The launcher process is replaced by Streamlit, which handles Ctrl+C itself.
+    """
+    # Strip asserts and docstrings from everything Streamlit imports
+    optimize_flags = ["-OO"] if streamlit_optimize_level() == 2 else []
+    
     try:
-        # Run streamlit with --reload flag
-        subprocess.run([
-            "streamlit", "run", 
+        # Run streamlit as a module of this interpreter, already an absolute path so no PATH lookup is needed
+        os.execv(sys.executable, [
+            sys.executable, *optimize_flags, "-m", "streamlit", "run", 
             "app.py",
-            "--reload",
-            "--server.runOnSave=true"  # Also enable run on save
-        ], check=True)
-    except KeyboardInterrupt:
-        print("\nShutting down gracefully...")
-        sys.exit(0)
-    except Exception as e:
+            "--server.runOnSave=true"  # Rerun the app when a source file is saved
+        ])
+    except OSError as e:
         print(f"Error running Streamlit: {e}")
         sys.exit(1)
 